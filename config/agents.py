@@ -3,11 +3,15 @@ config/agents.py
 
 This module provides configurations for AI models used in different phases of analysis.
 It allows users to easily configure which models to use for each phase by updating
-the `MODEL_CONFIG` dictionary.
+the `MODEL_CONFIG` mapping.
 
 Users can specify a different model for each phase and whether to use reasoning.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
+
 from core.types.models import (
     ModelConfig,
     AZURE_GPT4O_DEFAULT,
@@ -21,8 +25,9 @@ from core.types.models import (
 # Define which model to use for each phase.
 # ====================================================
 
-# Default model configuration using Azure OpenAI
-MODEL_CONFIG = {
+# Default model configuration using Azure OpenAI.
+# Read-only at runtime: edit the entries below to change the configuration.
+MODEL_CONFIG = MappingProxyType({
     # Phase 1: Initial Discovery
     "phase1": AZURE_GPT4O_PRECISE,
     
@@ -40,4 +45,18 @@ MODEL_CONFIG = {
     
     # Final Analysis
     "final": AZURE_GPT4O_PRECISE,
-}
+})
+
+
+@lru_cache(maxsize=None)
+def get_model_for_phase(phase: str) -> Optional[ModelConfig]:
+    """
+    Get the model configuration for a phase.
+
+    Args:
+        phase: The phase name (e.g., "phase1", "final")
+
+    Returns:
+        The ModelConfig for the phase, or None if the phase is not configured
+    """
+    return MODEL_CONFIG.get(phase)
@@ -42,25 +42,27 @@ def format_phase3_prompt(context: Dict) -> str:
     else:
         file_content_str = str(file_contents)
     
-    # Return a formatted prompt
-    return f"""You are {agent_name}, responsible for {agent_role}.
+    # Return a formatted prompt. Static instructions and the tree (shared by every
+    # agent in a run) come first so requests share the longest possible prefix;
+    # agent-specific content follows.
+    return f"""Your task is to perform a deep analysis of the code files assigned to you in this project.
 
-Your task is to perform a deep analysis of the code files assigned to you in this project.
+Analyze the code following these guidelines:
+1. Focus on understanding the purpose and functionality of each file
+2. Identify key patterns and design decisions
+3. Note any potential issues, optimizations, or improvements
+4. Pay attention to relationships between different components
+5. Summarize your findings in a clear, structured format
+
+Format your response as a structured report with clear sections and findings for each file.
 
 TREE STRUCTURE:
 {tree_structure}
 
+You are {agent_name}, responsible for {agent_role}.
+
 ASSIGNED FILES:
 {assigned_files}
 
 FILE CONTENTS:
-{file_content_str}
-
-Analyze the code following these guidelines:
-1. Focus on understanding the purpose and functionality of each file
-2. Identify key patterns and design decisions
-3. Note any potential issues, optimizations, or improvements
-4. Pay attention to relationships between different components
-5. Summarize your findings in a clear, structured format
-
-Format your response as a structured report with clear sections and findings for each file.""" 
\ No newline at end of file
+{file_content_str}"""
\ No newline at end of file
@@ -4,4 +4,4 @@ core/agents package
 This package contains agent classes for interacting with different AI models.
 """
 
-from .factory import get_architect_for_phase 
\ No newline at end of file
+from .factory import get_architect_for_phase, get_architect_for_config
\ No newline at end of file
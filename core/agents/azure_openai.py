@@ -13,20 +13,33 @@ with Azure OpenAI integration.
 # This section imports all the required libraries and modules.
 # ====================================================
 
+import asyncio
+import copy
+import hashlib
+import importlib.util
 import json
 import logging
 import os
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Union
-from openai import AzureOpenAI
-from azure.core.credentials import AzureKeyCredential
-from openai.types.chat.chat_completion_user_message_param import (
-    ChatCompletionUserMessageParam,
+import httpx
+from openai import (
+    AsyncAzureOpenAI,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
 )
-from openai.types.chat.chat_completion_system_message_param import (
-    ChatCompletionSystemMessageParam,
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
 )
 
 from core.agents.base import BaseArchitect, ModelProvider, ReasoningMode
+from core.utils.tools.json_helpers import json_dumps
 from config.prompts.phase_2_prompts import PHASE_2_PROMPT, format_phase2_prompt
 from config.prompts.phase_4_prompts import PHASE_4_PROMPT, format_phase4_prompt
 from config.prompts.final_analysis_prompt import (
@@ -34,6 +47,180 @@ from config.prompts.final_analysis_prompt import (
     format_final_analysis_prompt,
 )
 
+# ====================================================
+# Azure OpenAI Environment Configuration
+# Read once at import time; the environment is loaded (e.g. from .env)
+# before this module is imported.
+# ====================================================
+
+_AZURE_ENDPOINT = os.environ.get("AZURE_ENDPOINT")
+_AZURE_API_KEY = os.environ.get("AZURE_API_KEY")
+_AZURE_DEPLOYMENT = os.environ.get("AZURE_DEPLOYMENT")
+
+
+def _require_env() -> None:
+    """
+    Ensure the required Azure OpenAI environment variables were set.
+
+    Raises:
+        ValueError: If AZURE_ENDPOINT or AZURE_API_KEY is missing
+    """
+    if not _AZURE_ENDPOINT or not _AZURE_API_KEY:
+        raise ValueError(
+            "AZURE_ENDPOINT and AZURE_API_KEY environment variables must be set"
+        )
+
+
+# ====================================================
+# HTTP Transport
+# One pooled connection set for all Azure OpenAI traffic. With HTTP/2 the
+# concurrent phase requests are multiplexed over a single TLS connection.
+# An httpx.AsyncClient's connections belong to the event loop that opened
+# them, so the clients are rebuilt when a new loop (e.g. a second
+# asyncio.run()) starts using them.
+# ====================================================
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None  # installed by httpx[http2]
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+# Generous read timeout (the SDK default) since long completions stream slowly
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+
+_client_loop: Optional[asyncio.AbstractEventLoop] = None  # The loop _clients belong to
+_clients: Dict[tuple, AsyncAzureOpenAI] = {}
+
+
+def _get_client(
+    api_version: str, endpoint: str, api_key: str, max_retries: Optional[int] = None
+) -> AsyncAzureOpenAI:
+    """
+    Get the shared Azure OpenAI client for the given settings and the running event loop.
+
+    Reusing one client keeps its connection pool (and warm TLS sessions)
+    shared across all architect instances. Must be called from a coroutine.
+
+    Args:
+        api_version: Azure OpenAI API version
+        endpoint: Azure OpenAI endpoint URL
+        api_key: Azure OpenAI API key
+        max_retries: Override for the SDK's built-in retries; the returned
+            client still shares the default client's connection pool
+
+    Returns:
+        The memoized AsyncAzureOpenAI client
+    """
+    global _client_loop
+    loop = asyncio.get_running_loop()
+    if loop is not _client_loop:
+        # The previous loop's connections can't be used (or closed) from this one
+        _clients.clear()
+        _client_loop = loop
+
+    key = (api_version, endpoint, api_key, max_retries)
+    client = _clients.get(key)
+    if client is None:
+        if max_retries is not None:
+            client = _get_client(api_version, endpoint, api_key).with_options(
+                max_retries=max_retries
+            )
+        else:
+            http_client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                limits=_HTTP_LIMITS,
+                timeout=_HTTP_TIMEOUT,
+            )
+            client = AsyncAzureOpenAI(
+                api_version=api_version,
+                azure_endpoint=endpoint,
+                api_key=api_key,
+                http_client=http_client,
+            )
+        _clients[key] = client
+    return client
+
+
+def _response_content(response: Dict) -> str:
+    """
+    Extract the message content of the first choice from a completion dict.
+
+    Args:
+        response: Completion returned by _call_azure_openai
+
+    Returns:
+        The message content, or an empty string if there is none
+    """
+    return response.get("choices", [{}])[0].get("message", {}).get("content") or ""
+
+
+def _to_json(obj: Any) -> str:
+    """
+    Serialize a prompt payload to JSON, passing pre-serialized strings through.
+
+    Callers that send the same payload to several architects can serialize it
+    once and pass the string down instead of re-encoding it on every call.
+
+    Args:
+        obj: A JSON-serializable object, or an already serialized JSON string
+
+    Returns:
+        The JSON string
+    """
+    if isinstance(obj, str):
+        return obj
+    return json_dumps(obj)
+
+
+# ====================================================
+# Response Cache
+# Completions keyed by a hash of the request. Repeating an identical request
+# within a run reuses the answer. Only architects whose model configuration
+# opts in with cache_responses use it: at a nonzero temperature a repeated
+# request would otherwise get a fresh sample.
+# ====================================================
+
+RESPONSE_CACHE_SIZE = 128
+_RESPONSE_CACHE: "OrderedDict[str, Dict]" = OrderedDict()  # Least recently used first
+
+# ====================================================
+# Retry Policy
+# Transient failures (rate limits, timeouts, dropped connections, 5xx) are
+# retried with jittered exponential backoff so one failure doesn't sink a phase.
+# ====================================================
+
+MAX_REQUEST_ATTEMPTS = 3
+_RETRYABLE_ERRORS = (
+    RateLimitError,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+)
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    """
+    Log a transient Azure OpenAI failure that is about to be retried.
+
+    Only the final failure is logged as an error (by _call_azure_openai), so a
+    request that succeeds on a later attempt leaves warnings, not errors.
+
+    Args:
+        retry_state: Tenacity's state for the failed attempt
+    """
+    logging.warning(
+        f"Azure OpenAI request failed (attempt {retry_state.attempt_number} of "
+        f"{MAX_REQUEST_ATTEMPTS}), retrying in {retry_state.next_action.sleep:.1f}s: "
+        f"{retry_state.outcome.exception()}"
+    )
+
+
+# ====================================================
+# Batch API
+# Settings for offline jobs submitted to the Azure OpenAI Batch API.
+# ====================================================
+
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 30  # seconds
+_BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
 # ====================================================
 # AzureOpenAIArchitect Class
 # This class provides integration with Azure OpenAI models
@@ -59,24 +246,14 @@ class AzureOpenAIArchitect(BaseArchitect):
         """
         super().__init__(model_config=model_config, system_prompt=system_prompt)
         # Get Azure OpenAI configuration
-        self.endpoint = os.environ.get("AZURE_ENDPOINT")
-        self.api_key = os.environ.get("AZURE_API_KEY")
+        _require_env()
+        self.endpoint = _AZURE_ENDPOINT
+        self.api_key = _AZURE_API_KEY
         self.api_version = "2024-12-01-preview"
 
-        if not self.endpoint or not self.api_key:
-            raise ValueError(
-                "AZURE_ENDPOINT and AZURE_API_KEY environment variables must be set"
-            )
-
         # Get deployment name from environment or use the one from model_config
-        self.env_deployment = os.environ.get("AZURE_DEPLOYMENT")
+        self.env_deployment = _AZURE_DEPLOYMENT
 
-        # Initialize the Azure OpenAI client
-        self.client = AzureOpenAI(
-            api_version=self.api_version,
-            azure_endpoint=self.endpoint,
-            api_key=self.api_key,
-        )
         # Set model parameters from configuration
         # Use environment variable for deployment if available, otherwise use config
         self.deployment = self.env_deployment or model_config.get(
@@ -88,6 +265,20 @@ class AzureOpenAIArchitect(BaseArchitect):
         self.top_p = model_config.get("top_p", 0.95)
         self.provider = ModelProvider.AZURE_OPENAI
         self.reasoning_mode = model_config.get("reasoning_mode", ReasoningMode.MEDIUM)
+        self.use_batch_api = model_config.get("use_batch_api", False)
+        self.cache_responses = model_config.get("cache_responses", False)
+
+        # The system message never changes, so build its message dict once and
+        # reuse it as the first entry of every request
+        self._system_msg = {"role": "system", "content": self.system_message}
+
+        # Request parameters shared by every completion call from this architect
+        self._base_kwargs = {
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "model": self.deployment,
+        }
 
     def get_provider(self) -> ModelProvider:
         """Get the model provider type."""
@@ -97,27 +288,65 @@ class AzureOpenAIArchitect(BaseArchitect):
         """Get the reasoning mode being used."""
         return self.reasoning_mode
 
-    async def analyze(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    @property
+    def client(self) -> AsyncAzureOpenAI:
+        """The shared async Azure OpenAI client for the running event loop."""
+        return _get_client(self.api_version, self.endpoint, self.api_key)
+
+    @property
+    def _retry_free_client(self) -> AsyncAzureOpenAI:
+        """
+        The shared client with the SDK's built-in retries disabled.
+
+        _call_azure_openai retries with its own backoff policy; the connection
+        pool is still shared with self.client.
+        """
+        return _get_client(self.api_version, self.endpoint, self.api_key, max_retries=0)
+
+    async def analyze(
+        self,
+        context: Union[Dict[str, Any], str],
+        messages: Optional[List[Dict[str, str]]] = None,
+    ) -> Dict[str, Any]:
         """
         Run analysis using the Azure OpenAI model.
 
         Args:
-            context: Dictionary containing the context for analysis
+            context: Dictionary containing the context for analysis, or its
+                pre-serialized JSON string
+            messages: Optional messages already built from context with
+                build_analyze_messages, so the context is not serialized again
 
         Returns:
             Dictionary containing the analysis results or error information
         """
-        messages = [
-            {"role": "system", "content": self.system_message},
+        if messages is None:
+            messages = self.build_analyze_messages(context)
+
+        response = await self._call_azure_openai(messages)
+        return {"analysis": response}
+
+    def build_analyze_messages(
+        self, context: Union[Dict[str, Any], str]
+    ) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for an analyze request.
+
+        Args:
+            context: Dictionary containing the context for analysis, or its
+                pre-serialized JSON string
+
+        Returns:
+            List of message dictionaries for the request
+        """
+        return [
+            self._system_msg,
             {
                 "role": "user",
-                "content": f"Analyze the following context: {json.dumps(context)}",
+                "content": f"Analyze the following context: {_to_json(context)}",
             },
         ]
 
-        response = await self._call_azure_openai(messages)
-        return {"analysis": response}
-
     async def analyze_project_phase_2(
         self,
         phase1_results: Dict[str, Any],
@@ -144,7 +373,7 @@ class AzureOpenAIArchitect(BaseArchitect):
 
         # Create messages for chat completion
         messages = [
-            {"role": "system", "content": self.system_message},
+            self._system_msg,
             {"role": "user", "content": prompt},
         ]
 
@@ -170,7 +399,7 @@ class AzureOpenAIArchitect(BaseArchitect):
 
         # Create messages for chat completion
         messages = [
-            {"role": "system", "content": self.system_message},
+            self._system_msg,
             {"role": "user", "content": prompt},
         ]
 
@@ -203,7 +432,7 @@ class AzureOpenAIArchitect(BaseArchitect):
 
         # Create messages for chat completion
         messages = [
-            {"role": "system", "content": self.system_message},
+            self._system_msg,
             {"role": "user", "content": prompt},
         ]
 
@@ -211,7 +440,7 @@ class AzureOpenAIArchitect(BaseArchitect):
         response = await self._call_azure_openai(messages)
 
         # Ensure response content is a string
-        content = response.get("choices", [{}])[0].get("message", {}).get("content", "")
+        content = _response_content(response)
 
         return {"final_analysis": content}
 
@@ -243,7 +472,7 @@ class AzureOpenAIArchitect(BaseArchitect):
 
         # Create messages for chat completion
         messages = [
-            {"role": "system", "content": self.system_message},
+            self._system_msg,
             {"role": "user", "content": prompt},
         ]
 
@@ -266,11 +495,11 @@ class AzureOpenAIArchitect(BaseArchitect):
             Dictionary containing the analysis plan
         """
         messages = [
-            {"role": "system", "content": self.system_message},
+            self._system_msg,
             {
                 "role": "user",
                 "content": prompt
-                or f"Create an analysis plan for this project: {json.dumps(phase1_results)}",
+                or f"Create an analysis plan for this project: {_to_json(phase1_results)}",
             },
         ]
 
@@ -290,10 +519,10 @@ class AzureOpenAIArchitect(BaseArchitect):
             Dictionary containing synthesized findings
         """
         messages = [
-            {"role": "system", "content": self.system_message},
+            self._system_msg,
             {
                 "role": "user",
-                "content": f"Synthesize the following analysis results: {json.dumps(analysis_results)}",
+                "content": f"Synthesize the following analysis results: {_to_json(analysis_results)}",
             },
         ]
 
@@ -315,17 +544,106 @@ class AzureOpenAIArchitect(BaseArchitect):
         """
         user_prompt = (
             prompt
-            or f"Consolidate the following analysis results: {json.dumps(all_results)}"
+            or f"Consolidate the following analysis results: {_to_json(all_results)}"
         )
 
         messages = [
-            {"role": "system", "content": self.system_message},
+            self._system_msg,
             {"role": "user", "content": user_prompt},
         ]
 
         response = await self._call_azure_openai(messages)
         return {"consolidated_report": response}
 
+    async def submit_batch(self, message_sets: List[List[Dict[str, str]]]) -> str:
+        """
+        Submit requests as an Azure OpenAI Batch API job.
+
+        Batch jobs complete within the 24 hour completion window at a lower
+        cost than interactive calls, which suits offline or CI runs.
+
+        Args:
+            message_sets: One list of message dictionaries per request.
+
+        Returns:
+            The ID of the created batch job.
+        """
+        lines = [
+            json_dumps(
+                {
+                    "custom_id": f"request-{i}",
+                    "method": "POST",
+                    "url": "/chat/completions",
+                    "body": {"messages": messages, **self._base_kwargs},
+                }
+            )
+            for i, messages in enumerate(message_sets)
+        ]
+
+        try:
+            batch_file = await self.client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/chat/completions",
+                completion_window=BATCH_COMPLETION_WINDOW,
+            )
+        except Exception as e:
+            logging.error(f"Error submitting Azure OpenAI batch job: {e}")
+            raise
+
+        logging.info(f"Submitted Azure OpenAI batch {batch.id} with {len(lines)} requests")
+        return batch.id
+
+    async def wait_for_batch(
+        self, batch_id: str, poll_interval: float = BATCH_POLL_INTERVAL
+    ) -> List[Dict]:
+        """
+        Wait for a Batch API job to finish and download its results.
+
+        Args:
+            batch_id: The ID returned by submit_batch.
+            poll_interval: Seconds to wait between status checks.
+
+        Returns:
+            One completion dictionary per submitted request, in submission order.
+            Requests that failed inside the batch are returned as {"error": ...}.
+
+        Raises:
+            RuntimeError: If the batch job does not complete successfully.
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.batches.retrieve(batch_id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Azure OpenAI batch {batch_id} ended with status '{batch.status}'")
+
+        results: Dict[int, Dict] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            output = await self.client.files.content(file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                index = int(record["custom_id"].rsplit("-", 1)[1])
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    results[index] = {"error": record.get("error") or response.get("body")}
+                else:
+                    results[index] = response["body"]
+
+        total = batch.request_counts.total if batch.request_counts else len(results)
+        return [
+            results.get(i, {"error": "No result returned for request"})
+            for i in range(total)
+        ]
+
     async def _call_azure_openai(self, messages: List[Dict[str, str]]) -> Dict:
         """
         Call the Azure OpenAI API with the given messages.
@@ -336,30 +654,51 @@ class AzureOpenAIArchitect(BaseArchitect):
         Returns:
             The response content from the API as a dictionary.
         """
+        # Repeated requests are answered from the cache when this architect opted in
+        cache_key = None
+        if self.cache_responses:
+            cache_key = hashlib.sha256(
+                json_dumps(
+                    [self._base_kwargs, messages],
+                    sort_keys=True,
+                ).encode("utf-8")
+            ).hexdigest()
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                _RESPONSE_CACHE.move_to_end(cache_key)
+                # Callers may modify the response, so never hand out the cached dict
+                return copy.deepcopy(cached)
+
         try:
-            # Ensure messages conform to the expected structure
-            formatted_messages = [
-                ChatCompletionUserMessageParam(role="user", content=msg["content"])
-                for msg in messages
-            ]
+            result = await self._create_completion(messages)
+        except Exception as e:
+            logging.error(f"Error calling Azure OpenAI API: {e}")
+            raise
 
-            response = self.client.chat.completions.create(
-                messages=formatted_messages,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                top_p=self.top_p,
-                model=self.deployment,
-            )
+        if cache_key is not None:
+            _RESPONSE_CACHE[cache_key] = copy.deepcopy(result)
+            if len(_RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+                _RESPONSE_CACHE.popitem(last=False)
+        return result
+
+    @retry(
+        stop=stop_after_attempt(MAX_REQUEST_ATTEMPTS),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+        before_sleep=_log_retry,
+        reraise=True,
+    )
+    async def _create_completion(self, messages: List[Dict[str, str]]) -> Dict:
+        """
+        Send one chat completion request, retrying transient failures.
 
-            # Correct the streaming logic to handle chunks properly
-            collected_content = []
-            for chunk in response:
-                # Adjust streaming logic to handle chunk as a tuple
-                if isinstance(chunk, tuple) and len(chunk) > 1:
-                    content = chunk[1].get("content", "")
-                    collected_content.append(content)
+        Args:
+            messages: List of message dictionaries to send to the API.
 
-            return {"streamed_content": "".join(collected_content)}
-        except Exception as e:
-            logging.error(f"Error streaming from Azure OpenAI API: {e}")
-            raise
+        Returns:
+            The completion as a dictionary.
+        """
+        response = await self._retry_free_client.chat.completions.create(
+            messages=messages, **self._base_kwargs
+        )
+        return response.model_dump()
@@ -102,8 +102,14 @@ class BaseArchitect(ABC):
         if model_config:
             self.model_config = model_config
         
-        # Set up system message
-        self.system_message = system_prompt or "You are a helpful assistant that analyzes code and provides architecture recommendations."
+        # Set up system message. It is fixed for the lifetime of the architect so
+        # every request shares a byte-identical prefix (eligible for prompt caching).
+        self._system_message = system_prompt or "You are a helpful assistant that analyzes code and provides architecture recommendations."
+
+    @property
+    def system_message(self) -> str:
+        """The system message sent with every request (read-only)."""
+        return self._system_message
         
     @abstractmethod
     async def analyze(self, context: Dict[str, Any]) -> Dict[str, Any]:
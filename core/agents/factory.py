@@ -8,40 +8,113 @@ It serves as a central hub for instantiating the right architect implementation
 based on the model configuration defined in config/agents.py.
 """
 
-from typing import Any, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple
 from .base import ModelProvider, ReasoningMode
-from .azure_openai import AzureOpenAIArchitect
+
+if TYPE_CHECKING:
+    from core.types.models import ModelConfig
+
+# ====================================================
+# Provider Builders
+# Each builder imports its architect class on first use (so only the SDK for
+# the configured provider is ever imported) and shapes the constructor
+# arguments that provider expects.
+# ====================================================
+
+# Sampling defaults for Azure OpenAI architects, overridable per call via kwargs
+_AZURE_DEFAULTS = MappingProxyType({
+    "max_tokens": 4096,
+    "top_p": 0.95,
+})
+
+
+def _build_azure_openai(config: "ModelConfig", kwargs: Dict[str, Any]) -> Any:
+    """Create an Azure OpenAI architect for the given model configuration."""
+    from .azure_openai import AzureOpenAIArchitect
+    model_config = {
+        **_AZURE_DEFAULTS,
+        "deployment": config.model_name,
+        "model": config.model_name,
+        "reasoning_mode": config.reasoning,
+        "temperature": config.temperature,
+        "use_batch_api": config.use_batch_api,
+        "cache_responses": config.cache_responses,
+        # Per-call overrides, limited to the sampling settings in _AZURE_DEFAULTS
+        **{key: kwargs[key] for key in _AZURE_DEFAULTS if key in kwargs},
+    }
+    return AzureOpenAIArchitect(model_config=model_config, system_prompt=kwargs.get("system_prompt"))
+
+
+_DISPATCH: Dict[ModelProvider, Callable[["ModelConfig", Dict[str, Any]], Any]] = {
+    ModelProvider.AZURE_OPENAI: _build_azure_openai,
+}
 
 def get_architect_for_phase(phase: str, **kwargs) -> Any:
     """
     Get the appropriate architect instance for a phase based on configuration.
-    
+
+    Architects are cached per (phase, kwargs), so repeat requests reuse the same
+    instance. Cached architects hold no client of their own: each request looks
+    up the connection pool for the running event loop, so an instance stays
+    usable across separate asyncio.run() calls. Calls with unhashable kwargs
+    (e.g. list-valued responsibilities) bypass the cache. Use
+    ``get_architect_for_phase.cache_clear()`` after changing the model configuration.
+
     Args:
         phase: The phase to get an architect for (e.g., "phase1", "phase2")
         **kwargs: Additional keyword arguments to pass to the architect constructor
-        
+
     Returns:
         An instance of the appropriate architect class for the specified phase
     """
+    kwargs_items = tuple(sorted(kwargs.items()))
+    try:
+        hash(kwargs_items)
+    except TypeError:
+        # Unhashable kwargs cannot be used as a cache key
+        return _build(phase, kwargs)
+    return _cached_build(phase, kwargs_items)
+
+
+@lru_cache(maxsize=32)
+def _cached_build(phase: str, kwargs_items: Tuple[Tuple[str, Any], ...]) -> Any:
+    """Cached wrapper around _build keyed by phase and sorted kwargs items."""
+    return _build(phase, dict(kwargs_items))
+
+
+get_architect_for_phase.cache_clear = _cached_build.cache_clear
+
+
+def _build(phase: str, kwargs: Dict[str, Any]) -> Any:
+    """Create a new architect instance for a phase (uncached)."""
     # Import here to avoid circular imports
-    from config.agents import MODEL_CONFIG
+    from config.agents import get_model_for_phase
     
     # Get model configuration for the phase
-    config = MODEL_CONFIG.get(phase)
+    config = get_model_for_phase(phase)
     if not config:
         raise ValueError(f"No model configuration found for phase '{phase}'")
-      # Create the appropriate architect instance
-    if config.provider == ModelProvider.AZURE_OPENAI:
-        return AzureOpenAIArchitect(
-            model_config={
-                "deployment": config.model_name,
-                "model": config.model_name,
-                "reasoning_mode": config.reasoning,
-                "temperature": config.temperature,
-                "max_tokens": kwargs.get("max_tokens", 4096),
-                "top_p": kwargs.get("top_p", 0.95)
-            },
-            system_prompt=kwargs.get("system_prompt")
-        )
-    else:
-        raise ValueError(f"Only Azure OpenAI provider is supported: {config.provider}")
\ No newline at end of file
+    return get_architect_for_config(config, **kwargs)
+
+
+def get_architect_for_config(config: "ModelConfig", **kwargs) -> Any:
+    """
+    Create an architect instance for an explicit model configuration.
+
+    Unlike ``get_architect_for_phase`` this does not consult MODEL_CONFIG and
+    does not cache the instance.
+
+    Args:
+        config: The model configuration to build an architect for
+        **kwargs: Additional keyword arguments to pass to the architect constructor
+
+    Returns:
+        An instance of the appropriate architect class for the configuration
+    """
+    # Dispatch to the builder for the configured provider
+    builder = _DISPATCH.get(config.provider)
+    if builder is None:
+        raise ValueError(f"Only Azure OpenAI provider is supported: {config.provider}")
+    return builder(config, kwargs)
@@ -16,8 +16,10 @@ from config.prompts.final_analysis_prompt import (
     format_final_analysis_prompt,
 )  # Function to format the final analysis prompt.
 from core.agents import (
+    get_architect_for_config,
     get_architect_for_phase,
 )  # Import for dynamic model configuration
+from core.types.models import ModelConfig  # Used for type hinting.
 
 # ====================================================
 # Logger Setup
@@ -48,12 +50,19 @@ class FinalAnalysis:
     # This method sets up the initial state of the FinalAnalysis class.
     # ====================================================
 
-    def __init__(self):
+    def __init__(self, model_config: Optional[ModelConfig] = None):
         """
         Initialize the Final Analysis with the architect from configuration.
+
+        Args:
+            model_config: Optional model configuration that takes precedence over
+                          MODEL_CONFIG["final"]
         """
-        # Use the factory function to get the appropriate architect based on configuration
-        self.architect = get_architect_for_phase("final")
+        if model_config is not None:
+            self.architect = get_architect_for_config(model_config)
+        else:
+            # Use the factory function to get the appropriate architect based on configuration
+            self.architect = get_architect_for_phase("final")
 
     # ====================================================
     # Run Method
@@ -109,8 +109,11 @@ class Phase1Analysis:
             )
             return result
 
+        # Serialize the shared context once instead of once per architect
+        context_json = json.dumps(context)
+
         architect_tasks = [
-            run_architect_with_logging(architect, context)
+            run_architect_with_logging(architect, context_json)
             for architect in self.architects
         ]
         results = await asyncio.gather(*architect_tasks)
@@ -11,6 +11,8 @@ It defines the agents and methods needed for in-depth analysis of the project's
 # ====================================================
 
 import asyncio
+import copy
+import hashlib
 import logging
 import json
 from typing import Dict, List, Any, Optional
@@ -20,6 +22,14 @@ from core.utils.tools.file_retriever import get_filtered_formatted_contents
 from core.agents import get_architect_for_phase
 from config.prompts.phase_3_prompts import format_phase3_prompt
 
+# ====================================================
+# Concurrency Limit
+# Upper bound on Phase 3 agents waiting on the model at the same time, so a
+# large Phase 2 plan doesn't open one request per agent at once.
+# ====================================================
+
+MAX_CONCURRENT_ANALYSES = 4
+
 # ====================================================
 # Phase 3 Analysis Class
 # This class handles the deep analysis phase (Phase 3) of the project.
@@ -153,24 +163,57 @@ class Phase3Analysis:
                 # Get the content of assigned files
                 file_contents = await self._get_file_contents(directory, assigned_files)
 
-                # Create the context for this agent
+                # Create the context for this agent. The tree is shared by all agents,
+                # so it goes first to keep the serialized request prefix identical.
                 context = {
+                    "tree_structure": tree,
                     "agent_name": agent_def.get("name", "Analysis Agent"),
                     "agent_role": agent_def.get("description", "Analyzing the project"),
                     "assigned_files": assigned_files,
                     "file_contents": file_contents,
-                    "tree_structure": tree,
                 }
 
                 # Create a formatted prompt for this agent
                 formatted_prompt = format_phase3_prompt(context)
                 context["formatted_prompt"] = formatted_prompt
 
+                # Serialize the request once; the same messages are sent as is
+                messages = architect.build_analyze_messages(context)
+                dedupe_key = self._dedupe_key(architect, messages)
+
                 # Add the analysis task
-                analysis_tasks.append(architect.analyze(context))
+                analysis_tasks.append((architect, context, messages, dedupe_key))
+
+            # Send identical requests only once and share the result
+            unique_tasks, task_slots = self._dedupe_tasks(analysis_tasks)
+            if len(unique_tasks) < len(analysis_tasks):
+                logging.info(
+                    f"[bold]Phase 3:[/bold] Skipping {len(analysis_tasks) - len(unique_tasks)} duplicate analysis requests"
+                )
+
+            if unique_tasks and all(
+                getattr(architect, "use_batch_api", False)
+                for architect, *_ in unique_tasks
+            ):
+                # Submit all agents as one offline Batch API job
+                unique_results = await self._run_batch(unique_tasks)
+            else:
+                # Run the analysis tasks in parallel, at most MAX_CONCURRENT_ANALYSES at a time
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+                unique_results = await asyncio.gather(
+                    *[
+                        self._analyze_bounded(semaphore, architect, context, messages)
+                        for architect, context, messages, _ in unique_tasks
+                    ]
+                )
 
-            # Run all analysis tasks in parallel
-            results = await asyncio.gather(*analysis_tasks)
+            # Agents that shared a request each get their own copy of the result
+            results = []
+            delivered = set()
+            for slot in task_slots:
+                result = unique_results[slot]
+                results.append(copy.deepcopy(result) if slot in delivered else result)
+                delivered.add(slot)
 
             logging.info(
                 f"[bold green]Phase 3:[/bold green] All {len(analysis_tasks)} agents completed their analysis"
@@ -182,6 +225,99 @@ class Phase3Analysis:
             logging.error(f"[bold red]Error in Phase 3:[/bold red] {str(e)}")
             return {"phase": "Deep Analysis", "error": str(e)}
 
+    @staticmethod
+    async def _analyze_bounded(
+        semaphore: asyncio.Semaphore,
+        architect: Any,
+        context: Dict,
+        messages: List[Dict[str, str]],
+    ) -> Dict:
+        """
+        Run one agent's analysis once the semaphore admits it.
+
+        Args:
+            semaphore: Semaphore shared by all of this run's analyses
+            architect: The architect running the analysis
+            context: The agent's analysis context
+            messages: The prepared messages to send
+
+        Returns:
+            The analysis result
+        """
+        async with semaphore:
+            return await architect.analyze(context, messages=messages)
+
+    @staticmethod
+    def _dedupe_key(architect: Any, messages: List[Dict[str, str]]) -> bytes:
+        """
+        Hash exactly what would be sent: the model, sampling settings and messages.
+
+        Only requests that are identical on the wire share a result. The hash
+        is fed the message strings directly instead of serializing them again.
+
+        Args:
+            architect: The architect that would run the analysis
+            messages: The messages the architect would send
+
+        Returns:
+            The SHA-256 digest identifying the request
+        """
+        digest = hashlib.sha256()
+        for attr in ("deployment", "model", "temperature", "max_tokens", "top_p"):
+            digest.update(repr(getattr(architect, attr, None)).encode("utf-8"))
+            digest.update(b"\0")
+        for message in messages:
+            digest.update(message["role"].encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(message["content"].encode("utf-8", "surrogatepass"))
+            digest.update(b"\0")
+        return digest.digest()
+
+    def _dedupe_tasks(self, analysis_tasks: List[tuple]) -> tuple:
+        """
+        Collapse analysis tasks that share a dedupe key.
+
+        Args:
+            analysis_tasks: List of (architect, context, messages, dedupe_key) tuples
+
+        Returns:
+            Tuple of (unique tasks, and for each original task the index of the
+            unique task whose result it shares)
+        """
+        unique_tasks = []
+        task_slots = []
+        seen = {}
+
+        for task in analysis_tasks:
+            key = task[3]
+            if key not in seen:
+                seen[key] = len(unique_tasks)
+                unique_tasks.append(task)
+            task_slots.append(seen[key])
+
+        return unique_tasks, task_slots
+
+    async def _run_batch(self, analysis_tasks: List[tuple]) -> List[Dict]:
+        """
+        Run the analysis tasks through the Azure OpenAI Batch API.
+
+        Args:
+            analysis_tasks: List of (architect, context, messages, dedupe_key) tuples
+
+        Returns:
+            List of analysis results, in the same order as analysis_tasks
+        """
+        message_sets = [messages for _, _, messages, _ in analysis_tasks]
+        submitter = analysis_tasks[0][0]
+
+        logging.info(
+            f"[bold]Phase 3:[/bold] Submitting {len(message_sets)} analyses to the Batch API"
+        )
+        batch_id = await submitter.submit_batch(message_sets)
+        responses = await submitter.wait_for_batch(batch_id)
+
+        return [{"analysis": response} for response in responses]
+
     async def _get_file_contents(
         self, directory: Path, assigned_files: List[str]
     ) -> Dict[str, str]:
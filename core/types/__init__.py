@@ -2,14 +2,54 @@
 core/types package
 
 This package contains type definitions for various components of the project.
+
+Names are re-exported lazily (PEP 562): the defining submodule is only
+imported the first time one of its names is accessed, so ``import core.types``
+does not pull in ``core.agents.base`` until a model configuration is needed.
 """
 
-from .agent_config import AgentConfig
-from .models import (
-    ModelConfig,
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent_config import AgentConfig
+    from .models import (
+        ModelConfig,
+        # Predefined Azure OpenAI model configurations
+        AZURE_GPT4O_DEFAULT,
+        AZURE_GPT4O_CREATIVE,
+        AZURE_GPT4O_PRECISE,
+        AZURE_GPT4_TURBO
+    )
+
+# ====================================================
+# Lazy Re-exports
+# Maps each public name to the submodule that defines it.
+# ====================================================
+
+_LAZY = {
+    "AgentConfig": ".agent_config",
+    "ModelConfig": ".models",
     # Predefined Azure OpenAI model configurations
-    AZURE_GPT4O_DEFAULT,
-    AZURE_GPT4O_CREATIVE,
-    AZURE_GPT4O_PRECISE,
-    AZURE_GPT4_TURBO
-)
\ No newline at end of file
+    "AZURE_GPT4O_DEFAULT": ".models",
+    "AZURE_GPT4O_CREATIVE": ".models",
+    "AZURE_GPT4O_PRECISE": ".models",
+    "AZURE_GPT4_TURBO": ".models",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access and cache the value."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -19,6 +19,8 @@ class ModelConfig(NamedTuple):
     model_name: str
     reasoning: ReasoningMode = ReasoningMode.DISABLED
     temperature: Optional[float] = None  # For temperature-based models like gpt-4.1
+    use_batch_api: bool = False  # Route bulk requests through the Azure OpenAI Batch API
+    cache_responses: bool = False  # Reuse the answer when an identical request repeats within a run
 
 # ====================================================
 # Predefined Model Configurations
@@ -17,13 +17,29 @@ for deep code analysis using Azure OpenAI integration.
 # those functions and tools available for use here.
 # ====================================================
 
+import asyncio
+import codecs
+import copy
+import io
 import os
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple, Generator
+from types import MappingProxyType
+from typing import BinaryIO, List, Dict, Set, FrozenSet, NamedTuple, Optional, Pattern, Tuple, Generator
 import fnmatch
 import logging
-import json
+import re
+import stat
+from functools import lru_cache
 from config.exclusions import EXCLUDED_DIRS, EXCLUDED_FILES, EXCLUDED_EXTENSIONS
+from core.utils.tools.json_helpers import json_dumps, json_dumps_bytes, json_load_file
+
+try:
+    from charset_normalizer import from_bytes  # Optional encoding detection for non-UTF-8 files
+except ImportError:
+    from_bytes = None
 
 # ====================================================
 # Initial Setup
@@ -34,8 +50,33 @@ from config.exclusions import EXCLUDED_DIRS, EXCLUDED_FILES, EXCLUDED_EXTENSIONS
 # Initialize logger
 logger = logging.getLogger("github_copilot_architect")
 
-# Define file encoding to try in order of preference
-ENCODINGS = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+# Define file encoding to try in order of preference. cp1252 comes before
+# latin-1: it decodes the same printable bytes, plus the quotes, dashes and euro
+# sign that latin-1 would turn into control characters, and it rejects the few
+# bytes it leaves undefined, so those files still reach the fallbacks below.
+ENCODINGS = ['utf-8', 'cp1252']
+
+# Decodes any byte sequence, so it is the last resort after detection
+FALLBACK_ENCODING = 'latin-1'
+
+# Byte order marks checked before the single-byte encodings, longest first
+# (the UTF-32 LE mark starts with the UTF-16 LE one)
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Detected encodings noisier than this are ignored (charset_normalizer's own default)
+MAX_DETECTION_CHAOS = 0.2
+
+# Default exclusions, built once: excluded file names plus a glob per excluded extension
+_DEFAULT_EXCLUDE_DIRS = EXCLUDED_DIRS
+_DEFAULT_EXCLUDE_PATTERNS = frozenset(EXCLUDED_FILES) | frozenset(f'*{ext}' for ext in EXCLUDED_EXTENSIONS)
+
+# Number of threads used to read files concurrently (file reads release the GIL)
+MAX_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 # ====================================================
@@ -56,17 +97,57 @@ def should_exclude(path: Path, exclude_dirs: Set[str], exclude_patterns: Set[str
     Returns:
         bool: True if the path should be excluded, False otherwise
     """
-    # Check if any part of the path is in excluded dirs
-    for part in path.parts:
-        if part in exclude_dirs:
-            return True
+    # Check if any part of the path is in excluded dirs (any collection is accepted;
+    # converting a frozenset, like the defaults, is free)
+    if not frozenset(exclude_dirs).isdisjoint(path.parts):
+        return True
     
     # Check filename against excluded patterns
-    for pattern in exclude_patterns:
-        if fnmatch.fnmatch(path.name, pattern):
-            return True
+    return _name_excluded(path.name, (), _compile_patterns(frozenset(exclude_patterns)))
+
+
+@lru_cache(maxsize=16)
+def _compile_patterns(exclude_patterns: frozenset) -> Optional[Pattern]:
+    """
+    Combine a set of glob patterns into a single compiled regex.
+
+    Matching one alternation is much cheaper than calling fnmatch once per
+    pattern for every file. Patterns are normcased the same way fnmatch does,
+    so matching stays case-insensitive on Windows.
+
+    Args:
+        exclude_patterns: Glob patterns to combine
+
+    Returns:
+        Optional[Pattern]: The combined regex, or None if there are no patterns
+    """
+    if not exclude_patterns:
+        return None
+    return re.compile("|".join(
+        f"(?:{fnmatch.translate(os.path.normcase(pattern))})"
+        for pattern in sorted(exclude_patterns)
+    ))
+
+
+def _name_excluded(name: str, exclude_dirs: Set[str], pattern_re: Optional[Pattern]) -> bool:
+    """
+    Check a single path component against the exclusion rules.
+
+    Used by the directory walk, where every ancestor component has already
+    been checked on the way down, so only the entry's own name needs testing.
+
+    Args:
+        name: The file or directory name to check
+        exclude_dirs: Set of directory names to exclude
+        pattern_re: Combined exclusion regex from _compile_patterns, or None
+
+    Returns:
+        bool: True if the name should be excluded, False otherwise
+    """
+    if name in exclude_dirs:
+        return True
     
-    return False
+    return pattern_re is not None and pattern_re.match(os.path.normcase(name)) is not None
 
 
 # ====================================================
@@ -79,24 +160,92 @@ def read_file_with_fallback(file_path: Path) -> Tuple[str, str]:
     """
     Read file content with encoding fallback.
     
+    The file is read from disk once. The same bytes are decoded with each of
+    ENCODINGS in turn (a UTF-16/32 byte order mark is honored before the
+    single-byte encodings). Only if none of them fits is the encoding detected
+    with charset_normalizer, when it is installed, before falling back to
+    FALLBACK_ENCODING. Detection comes last because it is unreliable on short
+    source files, e.g. it reads a latin-1 'naïve' as cp1250 'naďve'. Files are
+    read into a buffer sized from fstat() rather than memory-mapped: a file
+    truncated by another process while mapped would crash the process with
+    SIGBUS. Line endings are normalized to '\\n' as text-mode reads do.
+    
     Args:
         file_path: Path to the file
         
     Returns:
         Tuple[str, str]: Tuple of (file_content, encoding_used)
     """
+    with open(file_path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        content, encoding = _decode_with_fallback(_read_all(f, size))
+    
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content, encoding
+
+
+def _read_all(f, size_hint: int) -> memoryview:
+    """
+    Read the rest of an unbuffered binary file into a buffer sized up front.
+    
+    The buffer starts at the size already known from fstat() (plus one byte,
+    so a file that has not changed is confirmed complete by a single read
+    reaching EOF) and doubles only if the file turns out to be larger.
+    
+    Args:
+        f: A file opened with open(..., 'rb', buffering=0)
+        size_hint: Expected file size in bytes
+        
+    Returns:
+        memoryview: The bytes read
+    """
+    buffer = bytearray(size_hint + 1)
+    view = memoryview(buffer)
+    filled = 0
+    while True:
+        if filled == len(buffer):
+            # The file grew since fstat(); double the buffer (the view must be released first)
+            view.release()
+            buffer.extend(bytes(len(buffer)))
+            view = memoryview(buffer)
+        count = f.readinto(view[filled:])
+        if not count:
+            return view[:filled]
+        filled += count
+
+
+def _decode_with_fallback(raw) -> Tuple[str, str]:
+    """
+    Decode raw file bytes, picking the encoding as described in read_file_with_fallback.
+    
+    Args:
+        raw: The file's bytes (bytes or any buffer, such as a memoryview)
+        
+    Returns:
+        Tuple[str, str]: Tuple of (decoded_content, encoding_used)
+    """
+    for bom, encoding in _BOM_ENCODINGS:
+        if raw[:len(bom)] == bom:
+            try:
+                return str(raw, encoding), encoding
+            except UnicodeDecodeError:
+                break
+    
     for encoding in ENCODINGS:
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-            return content, encoding
+            return str(raw, encoding), encoding
         except UnicodeDecodeError:
             continue
     
-    # If all encodings fail, read as binary and decode with replacement
-    with open(file_path, 'rb') as f:
-        content = f.read().decode('utf-8', errors='replace')
-    return content, 'utf-8 (with replacement)'
+    if from_bytes is not None:
+        match = from_bytes(bytes(raw)).best()
+        # Without a byte order mark a UTF-16/32 guess is just an even byte count
+        if (match is not None and match.chaos <= MAX_DETECTION_CHAOS
+                and not match.encoding.startswith(('utf_16', 'utf_32'))):
+            return str(match), match.encoding
+    
+    return str(raw, FALLBACK_ENCODING), FALLBACK_ENCODING
 
 
 # ====================================================
@@ -116,9 +265,48 @@ def format_file_content(file_path: Path, content: str) -> str:
     Returns:
         str: Formatted file content with path
     """
-    relative_path = file_path.as_posix()
-    language = detect_language(file_path)
-    return f"<file path=\"{relative_path}\" language=\"{language}\">\n{content}\n</file>"
+    return _format_file_content(file_path.as_posix(), content)
+
+
+def _format_file_content(posix_path: str, content: str) -> str:
+    """String-path form of format_file_content, used by the directory readers."""
+    language = _EXTENSION_MAP.get(os.path.splitext(posix_path)[1].lower(), 'text')
+    return f"<file path=\"{posix_path}\" language=\"{language}\">\n{content}\n</file>"
+
+
+# Map of file extensions to language names (read-only)
+_EXTENSION_MAP = MappingProxyType({
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'jsx',
+    '.tsx': 'tsx',
+    '.html': 'html',
+    '.css': 'css',
+    '.json': 'json',
+    '.md': 'markdown',
+    '.c': 'c',
+    '.cpp': 'cpp',
+    '.java': 'java',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.rb': 'ruby',
+    '.php': 'php',
+    '.cs': 'csharp',
+    '.sh': 'shell',
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+    '.xml': 'xml',
+    '.sql': 'sql',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.dart': 'dart',
+    '.vue': 'vue',
+    '.scss': 'scss',
+    '.less': 'less',
+    '.tf': 'terraform',
+    '.ps1': 'powershell',
+})
 
 
 def detect_language(file_path: Path) -> str:
@@ -131,41 +319,7 @@ def detect_language(file_path: Path) -> str:
     Returns:
         str: Language name or 'text' if unknown
     """
-    extension_map = {
-        '.py': 'python',
-        '.js': 'javascript',
-        '.ts': 'typescript',
-        '.jsx': 'jsx',
-        '.tsx': 'tsx',
-        '.html': 'html',
-        '.css': 'css',
-        '.json': 'json',
-        '.md': 'markdown',
-        '.c': 'c',
-        '.cpp': 'cpp',
-        '.java': 'java',
-        '.go': 'go',
-        '.rs': 'rust',
-        '.rb': 'ruby',
-        '.php': 'php',
-        '.cs': 'csharp',
-        '.sh': 'shell',
-        '.yml': 'yaml', 
-        '.yaml': 'yaml',
-        '.xml': 'xml',
-        '.sql': 'sql',
-        '.swift': 'swift',
-        '.kt': 'kotlin',
-        '.dart': 'dart',
-        '.vue': 'vue',
-        '.scss': 'scss',
-        '.less': 'less',
-        '.tf': 'terraform',
-        '.ps1': 'powershell',
-    }
-    
-    suffix = file_path.suffix.lower()
-    return extension_map.get(suffix, 'text')
+    return _EXTENSION_MAP.get(file_path.suffix.lower(), 'text')
 
 
 # ====================================================
@@ -193,36 +347,104 @@ def list_files(
     Yields:
         Path: File paths that match criteria
     """
+    exclude_dirs, exclude_patterns = _resolve_exclusions(exclude_dirs, exclude_patterns)
+    
+    for entry in _iter_file_entries(directory, exclude_dirs, exclude_patterns, max_depth):
+        yield Path(entry.path)
+
+
+def _resolve_exclusions(
+    exclude_dirs: Optional[Set[str]],
+    exclude_patterns: Optional[Set[str]],
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Fill in the default exclusion rules from config/exclusions.py where none were given.
+
+    Caller-supplied collections (which may be lists or tuples) are converted to
+    frozensets once here, so every membership test during the walk is O(1).
+    Frozensets, including the defaults, are passed through without copying.
+
+    Args:
+        exclude_dirs: Collection of directory names to exclude, or None for the defaults
+        exclude_patterns: Collection of file patterns to exclude, or None for the defaults
+
+    Returns:
+        Tuple[FrozenSet[str], FrozenSet[str]]: The (exclude_dirs, exclude_patterns) to use
+    """
     if exclude_dirs is None:
-        exclude_dirs = EXCLUDED_DIRS
+        exclude_dirs = _DEFAULT_EXCLUDE_DIRS
     
     if exclude_patterns is None:
-        # Combine excluded files and patterns based on extensions
-        exclude_patterns = set()
-        # Add excluded files
-        for file in EXCLUDED_FILES:
-            exclude_patterns.add(file)
-        # Add excluded extensions as patterns
-        for ext in EXCLUDED_EXTENSIONS:
-            exclude_patterns.add(f'*{ext}')
-    
-    def _list_files_recursive(path: Path, current_depth: int = 0) -> Generator[Path, None, None]:
-        if current_depth > max_depth:
-            return
-        
+        exclude_patterns = _DEFAULT_EXCLUDE_PATTERNS
+    
+    return frozenset(exclude_dirs), frozenset(exclude_patterns)
+
+
+def _iter_file_entries(
+    directory: Path,
+    exclude_dirs: Set[str],
+    exclude_patterns: Set[str],
+    max_depth: int,
+) -> Generator[os.DirEntry, None, None]:
+    """
+    Walk a directory with os.scandir and yield the DirEntry of every non-excluded file.
+
+    Entries come back in the same pre-order as a recursive iterdir() walk, but
+    the file/directory type comes from the cached readdir result instead of an
+    extra stat() per entry, and no Path objects are built along the way.
+
+    Args:
+        directory: Directory to search
+        exclude_dirs: Set of directory names to exclude
+        exclude_patterns: Set of file patterns to exclude
+        max_depth: Maximum depth to search
+
+    Yields:
+        os.DirEntry: Entries for files that match criteria
+    """
+    # Ancestors of the walk root count towards the excluded-directory check too
+    if max_depth < 0 or not exclude_dirs.isdisjoint(Path(directory).parts):
+        return
+    
+    pattern_re = _compile_patterns(frozenset(exclude_patterns))
+    
+    # Stack of open (scandir iterator, depth, path) entries, innermost last
+    stack = []
+    
+    def _open(path, depth: int) -> None:
         try:
-            for item in path.iterdir():
-                if should_exclude(item, exclude_dirs, exclude_patterns):
-                    continue
-                
-                if item.is_file():
-                    yield item
-                elif item.is_dir():
-                    yield from _list_files_recursive(item, current_depth + 1)
+            stack.append((os.scandir(path), depth, path))
         except PermissionError:
             logger.warning(f"Permission denied: {path}")
     
-    yield from _list_files_recursive(directory)
+    _open(directory, 0)
+    try:
+        while stack:
+            entries, depth, path = stack[-1]
+            try:
+                entry = next(entries, None)
+            except PermissionError:
+                logger.warning(f"Permission denied: {path}")
+                entry = None
+            
+            if entry is None:
+                entries.close()
+                stack.pop()
+                continue
+            
+            if _name_excluded(entry.name, exclude_dirs, pattern_re):
+                continue
+            
+            try:
+                if entry.is_file():
+                    yield entry
+                elif entry.is_dir() and depth < max_depth:
+                    _open(entry.path, depth + 1)
+            except OSError:
+                continue
+    finally:
+        for entries, _, _ in stack:
+            entries.close()
 
 
 # ====================================================
@@ -253,41 +475,140 @@ def get_file_contents(
     Returns:
         Dict[str, str]: Dictionary of {file_path: formatted_content}
     """
-    file_contents = {}
-    file_count = 0
+    return dict(iter_file_contents(
+        directory, exclude_dirs, exclude_patterns, max_size_kb, max_files, vscode_config
+    ))
+
+
+# ====================================================
+# Function: iter_file_contents
+# This function is the streaming form of get_file_contents: it yields
+# each file's formatted content as soon as it is read, so callers never
+# need to hold every file in memory at once.
+# ====================================================
+
+def iter_file_contents(
+    directory: Path,
+    exclude_dirs: Optional[Set[str]] = None,
+    exclude_patterns: Optional[Set[str]] = None,
+    max_size_kb: int = 1000,
+    max_files: int = 100,
+    vscode_config: bool = True
+) -> Generator[Tuple[str, str], None, None]:
+    """
+    Yield the contents of each file in a directory, excluding those that match exclusion patterns.
     
+    Takes the same arguments as get_file_contents. Files are read and formatted
+    on a thread pool, a bounded window ahead of the consumer, and yielded in
+    walk order.
+    
+    Args:
+        directory: Directory to search
+        exclude_dirs: Set of directory names to exclude
+        exclude_patterns: Set of file patterns to exclude
+        max_size_kb: Maximum file size in KB to process
+        max_files: Maximum number of files to process
+        vscode_config: Whether to include .vscode configuration files
+        
+    Yields:
+        Tuple[str, str]: The file's POSIX path relative to directory and its formatted content
+    """
     # Ensure .vscode directory is included if specified
     if vscode_config and exclude_dirs is not None and '.vscode' in exclude_dirs:
-        exclude_dirs = exclude_dirs.copy()
-        exclude_dirs.remove('.vscode')
+        exclude_dirs = set(exclude_dirs) - {'.vscode'}
     
-    for file_path in list_files(directory, exclude_dirs, exclude_patterns):
-        if file_count >= max_files:
+    exclude_dirs, exclude_patterns = _resolve_exclusions(exclude_dirs, exclude_patterns)
+    
+    # Collect the files to read, applying the size and count limits up front
+    file_paths = []
+    for entry in _iter_file_entries(directory, exclude_dirs, exclude_patterns, max_depth=10):
+        if len(file_paths) >= max_files:
             logger.warning(f"Reached maximum file limit of {max_files}")
             break
         
         # Check file size
         try:
-            file_size_kb = file_path.stat().st_size / 1024
-            if file_size_kb > max_size_kb:
-                logger.info(f"Skipping large file: {file_path} ({file_size_kb:.2f}KB)")
-                continue
-            
-            # Read file content
-            content, encoding = read_file_with_fallback(file_path)
-            
-            # Format content
-            formatted_content = format_file_content(file_path, content)
+            file_size_kb = entry.stat().st_size / 1024
+        except OSError as e:
+            logger.error(f"Error processing file {entry.path}: {str(e)}")
+            continue
+        if file_size_kb > max_size_kb:
+            logger.info(f"Skipping large file: {entry.path} ({file_size_kb:.2f}KB)")
+            continue
+        
+        file_paths.append(entry.path)
+    
+    if not file_paths:
+        return
+    
+    # Every walked path starts with the walk root, so relative paths are a slice
+    root_prefix_len = len(os.path.join(directory, ''))
+    display_prefix = _display_prefix(directory)
+    
+    # Read and format the files concurrently, keeping at most two reads per
+    # worker in flight so memory stays bounded when the consumer streams
+    max_workers = min(MAX_READ_WORKERS, len(file_paths))
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = deque()
+    paths = iter(file_paths)
+    try:
+        def _submit(file_path: str) -> None:
+            relative_path = _to_posix(file_path[root_prefix_len:])
+            future = executor.submit(_read_formatted_file, file_path, display_prefix + relative_path)
+            pending.append((file_path, relative_path, future))
+        
+        for file_path in islice(paths, 2 * max_workers):
+            _submit(file_path)
+        
+        while pending:
+            file_path, relative_path, future = pending.popleft()
+            next_path = next(paths, None)
+            if next_path is not None:
+                _submit(next_path)
             
-            # Add to dictionary
-            relative_path = file_path.relative_to(directory).as_posix()
-            file_contents[relative_path] = formatted_content
-            file_count += 1
+            try:
+                formatted_content = future.result()
+            except Exception as e:
+                logger.error(f"Error processing file {file_path}: {str(e)}")
+                continue
             
-        except Exception as e:
-            logger.error(f"Error processing file {file_path}: {str(e)}")
+            yield relative_path, formatted_content
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _read_formatted_file(file_path: str, display_path: str) -> str:
+    """
+    Read a file and format it for analysis (run on a worker thread).
     
-    return file_contents
+    Args:
+        file_path: Path to the file
+        display_path: POSIX path to show in the formatted output
+        
+    Returns:
+        str: Formatted file content with path
+    """
+    content, encoding = read_file_with_fallback(file_path)
+    return _format_file_content(display_path, content)
+
+
+def _display_prefix(directory: Path) -> str:
+    """
+    Get the prefix that turns a relative path into the POSIX form of directory / path.
+    
+    Args:
+        directory: The walk root
+        
+    Returns:
+        str: The root as a POSIX path with a trailing slash, or '' for the current directory
+    """
+    root = Path(directory).as_posix()
+    return '' if root == '.' else root.rstrip('/') + '/'
+
+
+def _to_posix(path: str) -> str:
+    """Convert an OS-native path string to POSIX separators, like Path.as_posix."""
+    return path if os.sep == '/' else path.replace(os.sep, '/')
 
 
 # ====================================================
@@ -309,16 +630,22 @@ def get_formatted_file_contents(directory: Path, include_vscode_info: bool = Tru
     Returns:
         str: All formatted file contents concatenated
     """
-    file_contents = get_file_contents(directory, vscode_config=include_vscode_info)
+    buffer = io.StringIO()
     
     # Add workspace analysis at the beginning if requested
     if include_vscode_info:
         workspace_info = analyze_workspace_structure(directory)
-        workspace_json = json.dumps(workspace_info, indent=2)
-        workspace_header = f"<workspace_info>\n{workspace_json}\n</workspace_info>"
-        return workspace_header + "\n\n" + "\n\n".join(file_contents.values())
+        workspace_json = json_dumps(workspace_info, indent=True)
+        buffer.write(f"<workspace_info>\n{workspace_json}\n</workspace_info>\n\n")
+    
+    # Write each file as it is read, so only the output buffer grows
+    separator = ""
+    for _, formatted_content in iter_file_contents(directory, vscode_config=include_vscode_info):
+        buffer.write(separator)
+        buffer.write(formatted_content)
+        separator = "\n\n"
     
-    return "\n\n".join(file_contents.values())
+    return buffer.getvalue()
 
 
 # ====================================================
@@ -333,6 +660,9 @@ def get_filtered_formatted_contents(directory: Path, files_to_include: List[str]
     Get formatted contents for only the specified files.
     Includes VSCode workspace information if specified.
     
+    Only the requested files are read. Paths that do not name a file directly
+    fall back to a fuzzy match against the workspace listing.
+    
     Args:
         directory: Base directory
         files_to_include: List of file paths to include
@@ -341,38 +671,219 @@ def get_filtered_formatted_contents(directory: Path, files_to_include: List[str]
     Returns:
         str: Formatted contents of the specified files
     """
-    all_contents = get_file_contents(directory, vscode_config=include_vscode_info)
-    filtered_contents = []
-    
-    for file_path in files_to_include:
-        if file_path in all_contents:
-            filtered_contents.append(all_contents[file_path])
-        else:
-            # Try to find the file with a fuzzy match
-            for path in all_contents:
-                if file_path in path or path.endswith(file_path):
-                    filtered_contents.append(all_contents[path])
-                    break
+    filtered_contents = [
+        formatted_content for _, formatted_content in _iter_requested_contents(directory, files_to_include)
+    ]
     
     # Add workspace analysis at the beginning if requested
     if include_vscode_info:
         workspace_info = analyze_workspace_structure(directory)
-        workspace_json = json.dumps(workspace_info, indent=2)
+        workspace_json = json_dumps(workspace_info, indent=True)
         workspace_header = f"<workspace_info>\n{workspace_json}\n</workspace_info>"
         return workspace_header + "\n\n" + "\n\n".join(filtered_contents)
     
     return "\n\n".join(filtered_contents)
 
 
+def _iter_requested_contents(directory: Path, files_to_include: List[str]) -> Generator[Tuple[str, str], None, None]:
+    """
+    Read and format each requested file, resolving the requests against the workspace.
+    
+    Each request is first tried as a path relative to the workspace. Otherwise
+    it falls back to a fuzzy match against the workspace listing, which is
+    walked once, without reading any files, on the first such request.
+    Matches always line up with whole path components, so "bar.py" never
+    resolves to "foo_bar.py". Requests that match nothing are skipped.
+    
+    Args:
+        directory: Base directory
+        files_to_include: List of file paths to include
+        
+    Yields:
+        Tuple[str, str]: The matched file's POSIX path relative to directory and its formatted content
+    """
+    exclude_dirs, exclude_patterns = _resolve_exclusions(None, None)
+    display_prefix = _display_prefix(directory)
+    workspace_index = _WorkspaceIndex(directory, exclude_dirs, exclude_patterns)
+    
+    try:
+        for file_path in files_to_include:
+            # Try the path as given, relative to the workspace
+            rel_path = _normalize_relative_path(file_path)
+            if rel_path is not None and not should_exclude(Path(rel_path), exclude_dirs, exclude_patterns):
+                formatted_content = _read_formatted_if_within_limit(
+                    os.path.join(directory, rel_path), display_prefix + rel_path
+                )
+                if formatted_content is not None:
+                    yield rel_path, formatted_content
+                    continue
+            
+            # Try to find the file with a fuzzy match: first by whole trailing path
+            # components, then, unless the request names a file (has an extension),
+            # by a partial path starting at a component boundary
+            query = rel_path or file_path
+            candidates = workspace_index.iter_suffix_matches(query)
+            if not os.path.splitext(query)[1]:
+                candidates = chain(candidates, workspace_index.iter_containing(query))
+            for path in candidates:
+                formatted_content = _read_formatted_if_within_limit(
+                    os.path.join(directory, path), display_prefix + path
+                )
+                if formatted_content is not None:
+                    yield path, formatted_content
+                    break
+    finally:
+        workspace_index.close()
+
+
+class _WorkspaceIndex:
+    """
+    Workspace file listing for fuzzy lookups, walked lazily as matches are needed.
+    
+    Paths are indexed by every trailing run of their components: for "a/b/c.py"
+    the keys are ("a", "b", "c.py"), ("b", "c.py") and ("c.py",). Matching whole
+    components means "bar.py" finds "x/bar.py" but not "x/foo_bar.py". These
+    matches have the highest priority, so the first one in walk order can be
+    returned as soon as the walk reaches it. Only the weaker partial-path
+    lookup needs the whole listing.
+    """
+    
+    def __init__(self, directory: Path, exclude_dirs: Set[str], exclude_patterns: Set[str]):
+        """
+        Prepare (but do not start) the walk of a workspace.
+        
+        Args:
+            directory: Base directory
+            exclude_dirs: Set of directory names to exclude
+            exclude_patterns: Set of file patterns to exclude
+        """
+        self._entries = _iter_file_entries(directory, exclude_dirs, exclude_patterns, max_depth=10)
+        self._root_prefix_len = len(os.path.join(directory, ''))
+        self._complete = False
+        self._paths = []  # Relative POSIX paths in walk order
+        self._suffix_index = {}
+    
+    def _advance(self) -> bool:
+        """Add the next walked file to the index; return False once the walk is exhausted."""
+        entry = next(self._entries, None)
+        if entry is None:
+            self._complete = True
+            return False
+        
+        path = _to_posix(entry.path[self._root_prefix_len:])
+        self._paths.append(path)
+        parts = tuple(path.split('/'))
+        for i in range(len(parts)):
+            self._suffix_index.setdefault(parts[i:], []).append(path)
+        return True
+    
+    def _load_all(self) -> List[str]:
+        """Finish the walk and return every path."""
+        while not self._complete and self._advance():
+            pass
+        return self._paths
+    
+    def iter_suffix_matches(self, suffix: str) -> Generator[str, None, None]:
+        """Yield paths whose trailing components equal suffix's, walking only as far as needed."""
+        key = tuple(suffix.split('/'))
+        yielded = 0
+        while True:
+            matches = self._suffix_index.get(key, ())
+            while yielded < len(matches):
+                yield matches[yielded]
+                yielded += 1
+            if self._complete or not self._advance():
+                return
+    
+    def iter_containing(self, text: str) -> Generator[str, None, None]:
+        """Yield paths containing text starting at a path-component boundary, in walk order."""
+        if not text:
+            return
+        component_start = '/' + text
+        for path in self._load_all():
+            if path.startswith(text) or component_start in path:
+                yield path
+    
+    def close(self) -> None:
+        """Stop the walk, closing any open directory handles."""
+        self._entries.close()
+
+
+def _normalize_relative_path(file_path: str) -> Optional[str]:
+    """
+    Normalize a workspace-relative path, rejecting paths that leave the workspace.
+    
+    Args:
+        file_path: Path relative to the workspace root
+        
+    Returns:
+        Optional[str]: The normalized POSIX path, or None if it is absolute or escapes the root
+    """
+    rel_path = Path(os.path.normpath(file_path))
+    if rel_path.is_absolute() or rel_path.parts[:1] == ('..',):
+        return None
+    return rel_path.as_posix()
+
+
+def _read_formatted_if_within_limit(file_path: str, display_path: str, max_size_kb: int = 1000) -> Optional[str]:
+    """
+    Read and format a single file if it exists and is within the size limit.
+    
+    Args:
+        file_path: Path to the file
+        display_path: POSIX path to show in the formatted output
+        max_size_kb: Maximum file size in KB to process
+        
+    Returns:
+        Optional[str]: Formatted file content, or None if the file was skipped
+    """
+    # A single stat() answers both "is it a regular file" and "how big is it"
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+    
+    try:
+        file_size_kb = file_stat.st_size / 1024
+        if file_size_kb > max_size_kb:
+            logger.info(f"Skipping large file: {file_path} ({file_size_kb:.2f}KB)")
+            return None
+        return _read_formatted_file(file_path, display_path)
+    except Exception as e:
+        logger.error(f"Error processing file {file_path}: {str(e)}")
+        return None
+
+
 # ====================================================
 # Additional VSCode-specific functions
 # These functions help with parsing and handling VSCode workspace files.
 # ====================================================
 
+def _mtime_ns(path: Path) -> Optional[int]:
+    """
+    Get a path's modification time in nanoseconds, for use in cache keys.
+    
+    Args:
+        path: The path to stat
+        
+    Returns:
+        Optional[int]: The mtime in nanoseconds, or None if the path does not exist
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def get_vscode_settings(directory: Path) -> Dict[str, any]:
     """
     Extract VS Code settings from the .vscode/settings.json file.
     
+    Results are cached per file and modification time; use
+    ``get_vscode_settings.cache_clear()`` to drop them.
+    
     Args:
         directory: The workspace directory
         
@@ -380,21 +891,33 @@ def get_vscode_settings(directory: Path) -> Dict[str, any]:
         Dict[str, any]: VS Code settings or empty dict if not found
     """
     settings_path = directory / '.vscode' / 'settings.json'
-    if not settings_path.exists():
+    mtime_ns = _mtime_ns(settings_path)
+    if mtime_ns is None:
         return {}
     
+    return copy.deepcopy(_get_vscode_settings_cached(str(settings_path.resolve()), mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _get_vscode_settings_cached(settings_path: str, mtime_ns: int) -> Dict[str, any]:
+    """Read and parse a settings.json file (cached by path and mtime)."""
     try:
-        with open(settings_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_load_file(settings_path)
     except Exception as e:
         logger.error(f"Error reading VS Code settings: {e}")
         return {}
 
 
+get_vscode_settings.cache_clear = _get_vscode_settings_cached.cache_clear
+
+
 def get_vscode_extensions(directory: Path) -> List[str]:
     """
     Extract recommended VS Code extensions from .vscode/extensions.json file.
     
+    Results are cached per file and modification time; use
+    ``get_vscode_extensions.cache_clear()`` to drop them.
+    
     Args:
         directory: The workspace directory
         
@@ -402,18 +925,27 @@ def get_vscode_extensions(directory: Path) -> List[str]:
         List[str]: List of recommended extensions or empty list if not found
     """
     extensions_path = directory / '.vscode' / 'extensions.json'
-    if not extensions_path.exists():
+    mtime_ns = _mtime_ns(extensions_path)
+    if mtime_ns is None:
         return []
     
+    return copy.deepcopy(_get_vscode_extensions_cached(str(extensions_path.resolve()), mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _get_vscode_extensions_cached(extensions_path: str, mtime_ns: int) -> List[str]:
+    """Read the recommendations from an extensions.json file (cached by path and mtime)."""
     try:
-        with open(extensions_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('recommendations', [])
+        data = json_load_file(extensions_path)
+        return data.get('recommendations', [])
     except Exception as e:
         logger.error(f"Error reading VS Code extensions: {e}")
         return []
 
 
+get_vscode_extensions.cache_clear = _get_vscode_extensions_cached.cache_clear
+
+
 def get_vscode_workspace_info(directory: Path) -> Dict[str, any]:
     """
     Get VS Code workspace information including settings and extensions.
@@ -434,46 +966,88 @@ def analyze_workspace_structure(directory: Path) -> Dict[str, any]:
     """
     Analyze the VSCode workspace structure to provide context for GitHub Copilot.
     
+    Results are cached per resolved directory. The key includes the
+    modification times of the directory and its VS Code config files, so
+    adding or removing top-level entries or editing the config invalidates
+    it; use ``analyze_workspace_structure.cache_clear()`` to drop it by hand.
+    
     Args:
         directory: The workspace directory
         
     Returns:
         Dict[str, any]: Workspace structure analysis
     """
+    vscode_dir = directory / '.vscode'
+    return copy.deepcopy(_analyze_workspace_structure_cached(
+        str(directory.resolve()),
+        _mtime_ns(directory),
+        _mtime_ns(vscode_dir / 'settings.json'),
+        _mtime_ns(vscode_dir / 'extensions.json'),
+    ))
+
+
+@lru_cache(maxsize=8)
+def _analyze_workspace_structure_cached(
+    directory_str: str,
+    mtime_ns: Optional[int],
+    settings_mtime_ns: Optional[int],
+    extensions_mtime_ns: Optional[int],
+) -> Dict[str, any]:
+    """Analyze a workspace directory (cached by resolved path and mtimes)."""
+    directory = Path(directory_str)
+    
     # Get basic files and directories
     try:
-        top_level_items = list(directory.glob("*"))
-        top_level_dirs = [item.name for item in top_level_items if item.is_dir() and not should_exclude(item, EXCLUDED_DIRS, set())]
-        top_level_files = [item.name for item in top_level_items if item.is_file() and not should_exclude(item, set(), EXCLUDED_FILES)]
-        
-        # Get VSCode specific info
-        vscode_info = get_vscode_workspace_info(directory)
-        
-        # Get information about package management and dependencies
-        has_package_json = (directory / "package.json").exists()
-        has_requirements_txt = (directory / "requirements.txt").exists()
-        has_pipfile = (directory / "Pipfile").exists()
-        has_poetry = (directory / "pyproject.toml").exists()
-        has_docker = (directory / "Dockerfile").exists() or (directory / "docker-compose.yml").exists()
-        
-        return {
-            "workspace_name": directory.name,
-            "top_level_directories": top_level_dirs,
-            "top_level_files": top_level_files,
-            "vscode_info": vscode_info,
-            "package_management": {
-                "has_package_json": has_package_json,
-                "has_requirements_txt": has_requirements_txt,
-                "has_pipfile": has_pipfile,
-                "has_poetry": has_poetry,
-                "has_docker": has_docker
-            }
-        }
+        with os.scandir(directory) as entries:
+            return _workspace_info_from_listing(directory, list(entries))
     except Exception as e:
         logger.error(f"Error analyzing workspace structure: {e}")
         return {"error": str(e)}
 
 
+analyze_workspace_structure.cache_clear = _analyze_workspace_structure_cached.cache_clear
+
+
+def _workspace_info_from_listing(directory: Path, top_level_entries: List[os.DirEntry]) -> Dict[str, any]:
+    """
+    Build analyze_workspace_structure's result from an already read top-level listing.
+    
+    Args:
+        directory: The workspace directory
+        top_level_entries: The scandir() entries directly in the directory
+        
+    Returns:
+        Dict[str, any]: Workspace structure analysis
+    """
+    top_level_dirs = [entry.name for entry in top_level_entries if entry.is_dir() and not should_exclude(Path(entry.path), EXCLUDED_DIRS, frozenset())]
+    top_level_files = [entry.name for entry in top_level_entries if entry.is_file() and not should_exclude(Path(entry.path), frozenset(), EXCLUDED_FILES)]
+    
+    # Get VSCode specific info
+    vscode_info = get_vscode_workspace_info(directory)
+    
+    # Get information about package management and dependencies
+    names = {entry.name for entry in top_level_entries}
+    has_package_json = "package.json" in names
+    has_requirements_txt = "requirements.txt" in names
+    has_pipfile = "Pipfile" in names
+    has_poetry = "pyproject.toml" in names
+    has_docker = "Dockerfile" in names or "docker-compose.yml" in names
+    
+    return {
+        "workspace_name": directory.name,
+        "top_level_directories": top_level_dirs,
+        "top_level_files": top_level_files,
+        "vscode_info": vscode_info,
+        "package_management": {
+            "has_package_json": has_package_json,
+            "has_requirements_txt": has_requirements_txt,
+            "has_pipfile": has_pipfile,
+            "has_poetry": has_poetry,
+            "has_docker": has_docker
+        }
+    }
+
+
 # ====================================================
 # GitHub Copilot Specific Functions
 # These functions help format data specifically for GitHub Copilot
@@ -483,6 +1057,9 @@ def get_github_copilot_ready_output(directory: Path, files_to_include: Optional[
     """
     Generate a GitHub Copilot-ready object containing workspace analysis and file contents.
     
+    When files_to_include is given, only those files are read (see
+    get_filtered_formatted_contents for how requests are matched).
+    
     Args:
         directory: Base workspace directory
         files_to_include: Optional list of specific files to include
@@ -493,22 +1070,31 @@ def get_github_copilot_ready_output(directory: Path, files_to_include: Optional[
     # Get workspace info
     workspace_info = analyze_workspace_structure(directory)
     
-    # Get file contents
-    if files_to_include:
-        all_contents = {}
-        all_files = get_file_contents(directory)
+    # Get file contents, reading only the requested files if any were given
+    return {
+        "workspace_info": workspace_info,
+        "file_contents": _read_requested_or_all(directory, files_to_include)
+    }
+
+
+async def get_github_copilot_ready_output_async(directory: Path, files_to_include: Optional[List[str]] = None) -> Dict[str, any]:
+    """
+    Async variant of get_github_copilot_ready_output for callers on an event loop.
+    
+    The workspace analysis and the file reads run on worker threads at the
+    same time, so the event loop is never blocked on the filesystem.
+    
+    Args:
+        directory: Base workspace directory
+        files_to_include: Optional list of specific files to include
         
-        for file_path in files_to_include:
-            if file_path in all_files:
-                all_contents[file_path] = all_files[file_path]
-            else:
-                # Try to find the file with a fuzzy match
-                for path in all_files:
-                    if file_path in path or path.endswith(file_path):
-                        all_contents[path] = all_files[path]
-                        break
-    else:
-        all_contents = get_file_contents(directory)
+    Returns:
+        Dict[str, any]: Dictionary with workspace_info and file_contents
+    """
+    workspace_info, all_contents = await asyncio.gather(
+        asyncio.to_thread(analyze_workspace_structure, directory),
+        asyncio.to_thread(_read_requested_or_all, directory, files_to_include)
+    )
     
     # Format the result as a GitHub Copilot-ready object
     return {
@@ -517,10 +1103,169 @@ def get_github_copilot_ready_output(directory: Path, files_to_include: Optional[
     }
 
 
+def _read_requested_or_all(directory: Path, files_to_include: Optional[List[str]]) -> Dict[str, str]:
+    """
+    Read the requested files, or every file in the workspace if none were requested.
+    
+    Args:
+        directory: Base workspace directory
+        files_to_include: Optional list of specific files to include
+        
+    Returns:
+        Dict[str, str]: Dictionary mapping relative file paths to formatted contents
+    """
+    if files_to_include:
+        return dict(_iter_requested_contents(directory, files_to_include))
+    return get_file_contents(directory)
+
+
+def get_github_copilot_ready_output_stream(
+    directory: Path,
+    fp: BinaryIO,
+    files_to_include: Optional[List[str]] = None,
+) -> None:
+    """
+    Write the GitHub Copilot-ready object as JSON to a binary file, one file at a time.
+    
+    Produces the same object as get_github_copilot_ready_output, but each
+    file's contents are encoded and written as soon as they are read, so the
+    full set of contents is never held in memory or serialized in one go.
+    
+    Args:
+        directory: Base workspace directory
+        fp: Binary file-like object to write the UTF-8 encoded JSON to
+        files_to_include: Optional list of specific files to include
+    """
+    fp.write(b'{"workspace_info":')
+    fp.write(json_dumps_bytes(analyze_workspace_structure(directory)))
+    fp.write(b',"file_contents":{')
+    
+    if files_to_include:
+        contents = _iter_requested_contents(directory, files_to_include)
+    else:
+        contents = iter_file_contents(directory)
+    
+    # Several requests can resolve to the same file; like the dict, keep the first
+    written = set()
+    separator = b''
+    for rel_path, formatted_content in contents:
+        if rel_path in written:
+            continue
+        written.add(rel_path)
+        fp.write(separator)
+        fp.write(json_dumps_bytes(rel_path))
+        fp.write(b':')
+        fp.write(json_dumps_bytes(formatted_content))
+        separator = b','
+    
+    fp.write(b'}}')
+
+
+# Walk top-level subdirectories on separate threads once there are at least this many
+PARALLEL_WALK_MIN_DIRS = 4
+
+
+class WalkResult(NamedTuple):
+    """What the workspace summary needs from a single walk of the directory tree."""
+    top_level_entries: List[os.DirEntry]  # Every entry directly in the directory, in listing order
+    language_counts: Dict[str, int]  # Number of files per language, in first-seen order
+
+
+def walk_once(directory: Path, max_depth: int = 10) -> WalkResult:
+    """
+    Walk a workspace once, collecting its top-level listing and language distribution.
+    
+    The top-level listing is read once and shared by the language count and
+    by callers that describe the top level (see get_github_copilot_summary),
+    instead of each listing the directory again. Only files whose extension maps to a language are
+    counted; anything else would just be unclassified noise in the distribution.
+    
+    With enough top-level subdirectories, each one is walked on its own thread
+    so their directory reads overlap (scandir releases the GIL while it waits
+    on the filesystem). Counts are merged in walk order, so the result is the
+    same as a single-threaded walk.
+    
+    Args:
+        directory: Base workspace directory
+        max_depth: Maximum depth to search
+        
+    Returns:
+        WalkResult: The top-level entries and the number of files per language
+    """
+    try:
+        with os.scandir(directory) as entries:
+            root_entries = list(entries)
+    except PermissionError:
+        logger.warning(f"Permission denied: {directory}")
+        return WalkResult([], {})
+    
+    if max_depth < 0 or not EXCLUDED_DIRS.isdisjoint(Path(directory).parts):
+        return WalkResult(root_entries, {})
+    
+    # Each root entry contributes either one file's language or, for a
+    # subdirectory (a None placeholder here), the next subtree's counts
+    parts = []
+    subdirs = []
+    for entry in root_entries:
+        if entry.name in EXCLUDED_DIRS:
+            continue
+        try:
+            if entry.is_file():
+                language = _language_of(entry.name)
+                if language is not None:
+                    parts.append(language)
+            elif entry.is_dir() and max_depth >= 1:
+                parts.append(None)
+                subdirs.append(entry.path)
+        except OSError:
+            continue
+    
+    if len(subdirs) >= PARALLEL_WALK_MIN_DIRS:
+        with ThreadPoolExecutor(max_workers=min(16, len(subdirs))) as executor:
+            futures = [executor.submit(_count_languages_serial, path, max_depth - 1) for path in subdirs]
+            subtree_counts = iter([future.result() for future in futures])
+    else:
+        subtree_counts = (_count_languages_serial(path, max_depth - 1) for path in subdirs)
+    
+    language_counts = Counter()
+    for language in parts:
+        if language is None:
+            language_counts.update(next(subtree_counts))
+        else:
+            language_counts[language] += 1
+    
+    return WalkResult(root_entries, dict(language_counts))
+
+
+def _count_languages_serial(directory: str, max_depth: int) -> Counter:
+    """Count files by language with a single-threaded walk."""
+    languages = (
+        _language_of(entry.name)
+        for entry in _iter_file_entries(directory, EXCLUDED_DIRS, frozenset(), max_depth)
+    )
+    return Counter(language for language in languages if language is not None)
+
+
+def _language_of(name: str) -> Optional[str]:
+    """Look up the language for a file name's extension, or None if unknown."""
+    return _EXTENSION_MAP.get(os.path.splitext(name)[1].lower())
+
+
+# Top-level files reported as "important" by the summary, in display order
+_IMPORTANT_FILES = ("main.py", "index.js", "app.py", "server.js", "package.json", "README.md", "requirements.txt")
+
+
 def get_github_copilot_summary(directory: Path) -> Dict[str, any]:
     """
     Generate a summary of the workspace for GitHub Copilot, focusing on high-level structure.
     
+    Results are cached like analyze_workspace_structure's: per resolved
+    directory, keyed on the modification times of the directory and its VS
+    Code config files. Only the top level is watched, so adding, removing or
+    renaming files in subdirectories leaves ``language_distribution`` stale
+    until ``get_github_copilot_summary.cache_clear()`` is called. Failures
+    are not cached.
+    
     Args:
         directory: Base workspace directory
         
@@ -528,33 +1273,45 @@ def get_github_copilot_summary(directory: Path) -> Dict[str, any]:
         Dict[str, any]: Dictionary with workspace summary information
     """
     try:
-        # Get workspace structure info
-        workspace_info = analyze_workspace_structure(directory)
-        
-        # Count files by language
-        language_counts = {}
-        for file_path in list_files(directory, EXCLUDED_DIRS, set()):
-            try:
-                language = detect_language(file_path)
-                language_counts[language] = language_counts.get(language, 0) + 1
-            except:
-                pass
-        
-        # Get main project files
-        important_files = []
-        for name in ["main.py", "index.js", "app.py", "server.js", "package.json", "README.md", "requirements.txt"]:
-            if (directory / name).exists():
-                important_files.append(name)
-        
-        # Create the summary
-        return {
-            "workspace_name": workspace_info["workspace_name"],
-            "important_files": important_files,
-            "language_distribution": language_counts,
-            "folder_structure": workspace_info["top_level_directories"],
-            "vscode_extensions": workspace_info["vscode_info"]["extensions"],
-            "package_management": workspace_info["package_management"]
-        }
+        vscode_dir = directory / '.vscode'
+        return copy.deepcopy(_get_github_copilot_summary_cached(
+            str(directory.resolve()),
+            _mtime_ns(directory),
+            _mtime_ns(vscode_dir / 'settings.json'),
+            _mtime_ns(vscode_dir / 'extensions.json'),
+        ))
     except Exception as e:
         logger.error(f"Error generating GitHub Copilot summary: {e}")
         return {"error": str(e)}
+
+
+@lru_cache(maxsize=64)
+def _get_github_copilot_summary_cached(
+    directory_str: str,
+    mtime_ns: Optional[int],
+    settings_mtime_ns: Optional[int],
+    extensions_mtime_ns: Optional[int],
+) -> Dict[str, any]:
+    """Summarize a workspace directory (cached by resolved path and mtimes); errors propagate uncached."""
+    directory = Path(directory_str)
+    
+    # Count files by language and list the top level in one walk
+    walk = walk_once(directory)
+    
+    # Get workspace structure info and main project files from the walk's top-level listing
+    workspace_info = _workspace_info_from_listing(directory, walk.top_level_entries)
+    top_level_names = {entry.name for entry in walk.top_level_entries}
+    important_files = [name for name in _IMPORTANT_FILES if name in top_level_names]
+    
+    # Create the summary
+    return {
+        "workspace_name": workspace_info["workspace_name"],
+        "important_files": important_files,
+        "language_distribution": walk.language_counts,
+        "folder_structure": workspace_info["top_level_directories"],
+        "vscode_extensions": workspace_info["vscode_info"]["extensions"],
+        "package_management": workspace_info["package_management"]
+    }
+
+
+get_github_copilot_summary.cache_clear = _get_github_copilot_summary_cached.cache_clear
@@ -0,0 +1,80 @@
+"""
+core/utils/tools/json_helpers.py
+
+This module provides the JSON helpers shared by the file retriever and the agents.
+They use orjson when it is installed and fall back to the standard json module
+otherwise, or for values orjson cannot handle (e.g. integers wider than 64 bits
+or types it does not know), so the output never depends on orjson being present.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson  # Optional C-accelerated JSON parser/serializer
+except ImportError:
+    orjson = None
+
+
+def json_dumps_bytes(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: A JSON-serializable object
+        indent: Whether to indent the output by two spaces instead of writing it compactly
+        sort_keys: Whether to sort dictionary keys in the output
+
+    Returns:
+        bytes: The encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass  # Let the json module serialize it or report the error
+    if indent:
+        text = json.dumps(obj, indent=2, sort_keys=sort_keys)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys)
+    return text.encode('utf-8')
+
+
+def json_dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: A JSON-serializable object
+        indent: Whether to indent the output by two spaces instead of writing it compactly
+        sort_keys: Whether to sort dictionary keys in the output
+
+    Returns:
+        str: The JSON string
+    """
+    return json_dumps_bytes(obj, indent=indent, sort_keys=sort_keys).decode('utf-8')
+
+
+def json_load_file(file_path: str) -> Any:
+    """
+    Read and parse a UTF-8 JSON file.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Any: The parsed JSON value
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # Let the json module parse it or report the error
+    return json.loads(raw.decode('utf-8'))
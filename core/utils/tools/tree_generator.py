@@ -20,7 +20,7 @@ from pathlib import Path  # Offers a way to interact with files and directories
 from typing import List, Set, Dict, Optional  # Used for type hinting, making code easier to understand
 import fnmatch  # Provides support for Unix shell-style wildcards
 from collections import defaultdict  # Provides a convenient way to create dictionaries where keys have default values
-from config.exclusions import EXCLUDED_DIRS, EXCLUDED_FILES, EXCLUDED_EXTENSIONS  # Importing predefined exclusion lists
+from config.exclusions import EXCLUDED_DIRS, EXCLUDED_FILES, EXCLUDED_EXTENSIONS, EXCLUDED_EXT_TUPLE  # Importing predefined exclusion lists
 
 # ====================================================
 # Setting Up Default Exclusion Constants
@@ -32,13 +32,11 @@ from config.exclusions import EXCLUDED_DIRS, EXCLUDED_FILES, EXCLUDED_EXTENSIONS
 DEFAULT_EXCLUDE_DIRS = EXCLUDED_DIRS
 
 # Combine excluded files and patterns based on extensions
-DEFAULT_EXCLUDE_PATTERNS = set()
-# Add excluded files
-for file in EXCLUDED_FILES:
-    DEFAULT_EXCLUDE_PATTERNS.add(file)
-# Add excluded extensions as patterns
-for ext in EXCLUDED_EXTENSIONS:
-    DEFAULT_EXCLUDE_PATTERNS.add(f'*{ext}')
+DEFAULT_EXCLUDE_PATTERNS = frozenset(EXCLUDED_FILES) | frozenset(f'*{ext}' for ext in EXCLUDED_EXTENSIONS)
+
+# Lowercased forms of the defaults, used by the fast path in should_exclude
+_EXCLUDED_FILES_LOWER = frozenset(name.lower() for name in EXCLUDED_FILES)
+_EXCLUDED_EXT_TUPLE_LOWER = tuple(ext.lower() for ext in EXCLUDED_EXT_TUPLE)
 
 # ====================================================
 # Defining File Type Icons and Descriptions
@@ -142,10 +140,17 @@ def should_exclude(item: Path, exclude_dirs: Set[str], exclude_patterns: Set[str
     Returns:
         bool: True if item should be excluded, False otherwise
     """
-    # Check if it's a directory in the exclude list
-    if item.is_dir() and (item.name in exclude_dirs):
+    # Check if it's a directory in the exclude list. The name lookup is the cheap
+    # fast-reject; only names that hit it pay for the is_dir() stat call.
+    if item.name in exclude_dirs and item.is_dir():
         return True
         
+    # Fast path for the default patterns: exact names plus one suffix scan,
+    # equivalent to fnmatch against '<name>' and '*<ext>' patterns
+    if exclude_patterns is DEFAULT_EXCLUDE_PATTERNS:
+        name = item.name.lower()
+        return name in _EXCLUDED_FILES_LOWER or name.endswith(_EXCLUDED_EXT_TUPLE_LOWER)
+
     # Check file patterns
     for pattern in exclude_patterns:
         if fnmatch.fnmatch(item.name.lower(), pattern.lower()):
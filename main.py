@@ -27,6 +27,11 @@ import time  # For measuring time taken for analysis
 from dotenv import load_dotenv  # For loading environment variables
 import asyncio  # Ensure asyncio is defined
 
+try:
+    import uvloop  # Faster libuv-based event loop (not available on Windows)
+except ImportError:
+    uvloop = None
+
 
 # Load environment variables from .env file if it exists
 if os.path.exists(".env"):
@@ -419,7 +424,12 @@ def main(path: str, output: str):
         )  # Print a message indicating which project is being analyzed
         analyzer = ProjectAnalyzer(directory)  # Create a `ProjectAnalyzer` instance
         start_time = time.time()  # Start timing here
-        analysis_result = asyncio.run(
+
+        # Use uvloop for the async phase pipeline when it is installed. uvloop.run
+        # creates its loop directly; event loop policies are deprecated in 3.14.
+        run = uvloop.run if uvloop is not None else asyncio.run
+
+        analysis_result = run(
             analyzer.analyze()
         )  # Run the analysis (this is an asynchronous operation)
 
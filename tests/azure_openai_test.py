@@ -13,6 +13,7 @@ import asyncio
 import sys
 import json
 from pathlib import Path
+from types import MappingProxyType
 from dotenv import load_dotenv
 from openai import AzureOpenAI
 
@@ -20,27 +21,30 @@ from openai import AzureOpenAI
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+# Load environment variables before importing modules that read them
+load_dotenv()
+
 # Import our modules
 from core.agents.azure_openai import AzureOpenAIArchitect
 from core.types.models import ReasoningMode
 
+# ANSI escape codes used by print_color
+_COLORS = MappingProxyType({
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "blue": "\033[94m",
+    "magenta": "\033[95m",
+    "reset": "\033[0m"
+})
+
 def print_color(text, color="green"):
     """Print colored text to the console."""
-    colors = {
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "magenta": "\033[95m",
-        "reset": "\033[0m"
-    }
-    print(f"{colors.get(color, colors['reset'])}{text}{colors['reset']}")
+    reset = _COLORS["reset"]
+    print(f"{_COLORS.get(color, reset)}{text}{reset}")
 
 async def test_azure_openai():
     """Test the Azure OpenAI integration."""
-    # Load environment variables
-    load_dotenv()
-
     # Check if the required environment variables are set
     azure_endpoint = os.environ.get("AZURE_ENDPOINT")
     azure_api_key = os.environ.get("AZURE_API_KEY")
@@ -62,12 +66,13 @@ async def test_azure_openai():
             "max_tokens": 1000
         }
 
-        architect = AzureOpenAIArchitect(
+        # Build the architect (and its HTTP client) on a worker thread while the
+        # test messages are prepared
+        architect_task = asyncio.create_task(asyncio.to_thread(
+            AzureOpenAIArchitect,
             model_config=model_config,
             system_prompt="You are a code analysis assistant."
-        )
-
-        print_color("Successfully created AzureOpenAIArchitect instance", "green")
+        ))
 
         # Test a simple query
         messages = [
@@ -81,6 +86,9 @@ async def test_azure_openai():
             }
         ]
 
+        architect = await architect_task
+        print_color("Successfully created AzureOpenAIArchitect instance", "green")
+
         print_color("Sending test query to Azure OpenAI...", "blue")
         response = await architect._call_azure_openai(messages)
 
@@ -24,9 +24,11 @@ from core.types.models import (
     ModelConfig
 )
 from config.agents import MODEL_CONFIG
-from core.agents import get_architect_for_phase
 from core.agents.base import ModelProvider, ReasoningMode
 
+# Maximum number of model tests running at once (keeps within API rate limits)
+MAX_CONCURRENT_TESTS = 4
+
 # Sample consolidated report for testing
 SAMPLE_CONSOLIDATED_REPORT = {
     "project_name": "Test Project",
@@ -73,14 +75,9 @@ async def test_model_config(model_config: ModelConfig, model_name: str):
     print(f"\n\nTesting with {model_name}: {model_config.provider.value} - {model_config.model_name}")
     print("-" * 50)
     
-    # Override the MODEL_CONFIG for this test
-    import config.agents
-    original_config = config.agents.MODEL_CONFIG.get("final")
-    config.agents.MODEL_CONFIG["final"] = model_config
-    
     try:
-        # Initialize the FinalAnalysis class
-        final_analysis = FinalAnalysis()
+        # Initialize the FinalAnalysis class with the model under test
+        final_analysis = FinalAnalysis(model_config=model_config)
         
         # Run the final analysis
         start_time = datetime.now()
@@ -105,16 +102,14 @@ async def test_model_config(model_config: ModelConfig, model_name: str):
         print(f"Tokens used: {result.get('tokens_used', 'Not available')}")
         
         # Print a sample of the output
-        output_sample = result.get("output", "")[:200] + "..." if result.get("output") else "No output"
+        output = result.get("output") or ""
+        output_sample = output[:200] + "..." if len(output) > 200 else (output or "No output")
         print(f"Output sample: {output_sample}")
         
         return True
     except Exception as e:
         print(f"❌ EXCEPTION: {str(e)}")
         return False
-    finally:
-        # Restore the original configuration
-        config.agents.MODEL_CONFIG["final"] = original_config
 
 async def run_all_tests():
     """Run tests with all available model configurations."""
@@ -134,10 +129,30 @@ async def run_all_tests():
     if current_model:
         models_to_test.append((current_model_name, current_model))
     
-    # Run all tests
-    results = {}
+    # Run each distinct configuration once, reusing the result for duplicates
+    seen = {}
     for model_name, model_config in models_to_test:
-        results[model_name] = await test_model_config(model_config, model_name)
+        if model_config in seen:
+            print(f"\n\nSkipping {model_name}: same configuration as {seen[model_config]}")
+        else:
+            seen[model_config] = model_name
+    
+    # The tests are independent network calls, so run them concurrently
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
+    
+    async def run_test(model_config: ModelConfig, model_name: str):
+        async with semaphore:
+            return await test_model_config(model_config, model_name)
+    
+    outcomes = await asyncio.gather(
+        *(run_test(model_config, model_name) for model_config, model_name in seen.items()),
+        return_exceptions=True
+    )
+    outcome_by_config = dict(zip(seen, outcomes))
+    results = {
+        model_name: outcome_by_config[model_config] is True
+        for model_name, model_config in models_to_test
+    }
     
     # Print summary
     print("\n\nTest Summary:")
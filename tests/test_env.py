@@ -22,7 +22,7 @@ api_keys = {
 print("\nAPI Key Status:")
 for key_name, key_value in api_keys.items():
     if key_value:
-        masked_key = key_value[:4] + "*" * (len(key_value) - 8) + key_value[-4:] if len(key_value) > 8 else "****"
+        masked_key = f"{key_value[:4]}{'*' * 8}{key_value[-4:]}" if len(key_value) > 8 else "****"
         print(f"✓ {key_name} is set: {masked_key}")
     else:
         print(f"✗ {key_name} is not set")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+tests/utils/file_retriever_test.py
+
+Simple tests for how file_retriever resolves requested file names and
+decodes files that are not UTF-8.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from core.utils.tools.file_retriever import _iter_requested_contents, read_file_with_fallback
+
+
+def make_workspace(root: Path, files):
+    """Create small files at the given relative POSIX paths under root."""
+    for rel_path in files:
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# {rel_path}\n", encoding='utf-8')
+
+
+def resolve(root: Path, requests):
+    """Return the relative paths the requests resolve to."""
+    return [rel_path for rel_path, _ in _iter_requested_contents(root, requests)]
+
+
+def test_file_name_matches_whole_component():
+    """'bar.py' resolves to x/bar.py, never to x/foo_bar.py."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_workspace(root, ["x/foo_bar.py", "y/bar.py"])
+        assert resolve(root, ["bar.py"]) == ["y/bar.py"]
+
+
+def test_file_name_without_component_match_is_skipped():
+    """A file name that only appears inside another name matches nothing."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_workspace(root, ["x/foo_bar.py"])
+        assert resolve(root, ["bar.py"]) == []
+
+
+def test_partial_path_starts_at_component_boundary():
+    """Requests without an extension may match a partial path, but only from a component start."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_workspace(root, ["src/foo_utils/a.py", "src/utils/b.py"])
+        assert resolve(root, ["utils"]) == ["src/utils/b.py"]
+
+
+def read_bytes_back(raw: bytes):
+    """Write raw bytes to a temporary file and read them back with read_file_with_fallback."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sample.py"
+        path.write_bytes(raw)
+        return read_file_with_fallback(path)
+
+
+def test_latin1_file_keeps_its_accents():
+    """Latin-1 source is not misread as UTF-16 or another code page."""
+    content, _ = read_bytes_back(b"caf\xe9\r\n")
+    assert content == "caf\u00e9\n", repr(content)
+    
+    content, _ = read_bytes_back('def naive():\n    return "na\u00efve"\n'.encode('latin-1'))
+    assert content == 'def naive():\n    return "na\u00efve"\n', repr(content)
+
+
+def test_cp1252_punctuation_is_decoded():
+    """Windows-1252 quotes, dashes and the euro sign do not become control characters."""
+    text = '# \u201cquoted\u201d \u20ac5 \u2013 dash\nx = 1\n'
+    content, encoding = read_bytes_back(text.encode('cp1252'))
+    assert (content, encoding) == (text, 'cp1252'), repr((content, encoding))
+
+
+if __name__ == "__main__":
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"PASSED: {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAILED: {test.__name__} {e}")
+    sys.exit(1 if failed else 0)